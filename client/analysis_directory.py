@@ -14,7 +14,16 @@ import textwrap
 from itertools import chain
 from pathlib import Path
 from time import time
-from typing import ContextManager, Dict, List, NamedTuple, Optional, Set, Tuple
+from typing import (
+    ContextManager,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from . import buck, json_rpc, log, statistics
 from .buck import BuckBuilder, find_buck_root
@@ -75,8 +84,8 @@ class BuckEvent(enum.Enum):
 
 
 def _resolve_filter_paths(
-    source_directories: List[str],
-    targets: List[str],
+    source_directories: Sequence[str],
+    targets: Sequence[str],
     configuration: Configuration,
     original_directory: str,
 ) -> Set[str]:
@@ -799,8 +808,8 @@ def _get_buck_builder(
 
 
 def resolve_analysis_directory(
-    source_directories: List[str],
-    targets: List[str],
+    source_directories: Sequence[str],
+    targets: Sequence[str],
     configuration: Configuration,
     original_directory: str,
     project_root: str,
@@ -844,7 +853,7 @@ def resolve_analysis_directory(
 
     if len(source_directories) == 1 and len(targets) == 0:
         analysis_directory = AnalysisDirectory(
-            source_directories.pop(),
+            source_directories[0],
             filter_paths=filter_paths,
             search_path=[
                 search_path.path()
@@ -857,8 +866,8 @@ def resolve_analysis_directory(
         )
 
         analysis_directory = SharedAnalysisDirectory(
-            source_directories=source_directories,
-            targets=targets,
+            source_directories=list(source_directories),
+            targets=list(targets),
             buck_builder=buck_builder,
             original_directory=original_directory,
             project_root=project_root,
@@ -5,7 +5,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
 
 
 TEXT: str = "text"
@@ -19,7 +19,7 @@ class CommandArguments:
     debug: bool = False
     sequential: bool = False
     strict: bool = False
-    additional_checks: List[str] = field(default_factory=list)
+    additional_checks: Tuple[str, ...] = ()
     show_error_traces: bool = False
     output: str = TEXT
     enable_profiling: bool = False
@@ -29,17 +29,17 @@ class CommandArguments:
     log_identifier: Optional[str] = None
     logger: Optional[str] = None
     formatter: Optional[str] = None
-    targets: List[str] = field(default_factory=list)
+    targets: Tuple[str, ...] = ()
     use_buck_builder: Optional[bool] = None
     use_buck_source_database: Optional[bool] = None
-    source_directories: List[str] = field(default_factory=list)
+    source_directories: Tuple[str, ...] = ()
     filter_directory: Optional[str] = None
     buck_mode: Optional[str] = None
     no_saved_state: bool = False
-    search_path: List[str] = field(default_factory=list)
+    search_path: Tuple[str, ...] = ()
     binary: Optional[str] = None
     buck_builder_binary: Optional[str] = None
-    exclude: List[str] = field(default_factory=list)
+    exclude: Tuple[str, ...] = ()
     typeshed: Optional[str] = None
     save_initial_state_to: Optional[str] = None
     load_initial_state_from: Optional[str] = None
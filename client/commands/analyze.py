@@ -4,7 +4,6 @@
 # LICENSE file in the root directory of this source tree.
 
 
-import enum
 from typing import List, Optional
 
 from typing_extensions import Final
@@ -13,11 +12,7 @@ from .. import command_arguments, log
 from ..analysis_directory import AnalysisDirectory, resolve_analysis_directory
 from ..configuration import Configuration
 from .check import Check
-
-
-class MissingFlowsKind(str, enum.Enum):
-    OBSCURE: str = "obscure"
-    TYPE: str = "type"
+from .command import MissingFlowsKind
 
 
 class Analyze(Check):
@@ -73,6 +73,11 @@ class ProfileOutput(enum.Enum):
         return self.value
 
 
+class MissingFlowsKind(str, enum.Enum):
+    OBSCURE: str = "obscure"
+    TYPE: str = "type"
+
+
 class Result:
     def __init__(self, code: int, output: str, error: Optional[str] = None) -> None:
         self.code: int = code
@@ -398,6 +403,10 @@ class Command(CommandParser, ABC):
     def configuration(self) -> Configuration:
         return self._configuration
 
+    @property
+    def original_directory(self) -> str:
+        return self._original_directory
+
     def _enable_logging_section(self, section: str) -> None:
         logging_sections = self._logging_sections
         if logging_sections:
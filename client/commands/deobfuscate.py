@@ -6,7 +6,7 @@
 import argparse
 from typing import List
 
-from . import Check
+from .check import Check
 
 
 class Deobfuscate(Check):
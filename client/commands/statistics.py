@@ -6,7 +6,7 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Type, Union
 
 import libcst as cst
 from libcst._exceptions import ParserSyntaxError
@@ -98,7 +98,7 @@ class Statistics(Command):
         *,
         configuration: Configuration,
         analysis_directory: Optional[AnalysisDirectory] = None,
-        filter_paths: List[str],
+        filter_paths: Iterable[str],
         log_results: bool,
     ) -> None:
         super(Statistics, self).__init__(
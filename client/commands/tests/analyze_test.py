@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 
 from ... import commands, find_directories
 from ...analysis_directory import AnalysisDirectory
+from ..analyze import Analyze
+from ..reporting import Reporting
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -23,7 +25,7 @@ class AnalyzeTest(unittest.TestCase):
     @patch("os.path.realpath")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_analyze(
         self, directories_to_analyze, realpath, check_output, find_global_and_local_root
     ) -> None:
@@ -41,7 +43,7 @@ class AnalyzeTest(unittest.TestCase):
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -72,13 +74,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
             configuration.taint_models_path = ["taint_models"]
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -111,13 +113,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
             configuration.taint_models_path = ["taint_models_1", "taint_models_2"]
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -152,13 +154,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
             configuration.taint_models_path = {"taint_models"}
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -191,14 +193,14 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
             configuration.taint_models_path = {"taint_models"}
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -232,14 +234,14 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         # Test "." is a valid directory
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -274,13 +276,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -315,13 +317,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -358,14 +360,14 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
 
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -400,13 +402,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -439,13 +441,13 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
 
         arguments = mock_arguments()
         with patch.object(
             commands.Command, "_call_client", return_value=result
         ) as call_client, patch("json.loads", return_value=[]):
-            command = commands.Analyze(
+            command = Analyze(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -479,4 +481,4 @@ class AnalyzeTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Analyze.NAME)
+            call_client.assert_called_once_with(command=Analyze.NAME)
@@ -12,6 +12,8 @@ from unittest.mock import MagicMock, patch
 
 from ... import commands, find_directories
 from ...analysis_directory import AnalysisDirectory
+from ..check import Check
+from ..reporting import Reporting
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -27,7 +29,7 @@ class CheckTest(unittest.TestCase):
     @patch("os.path.realpath")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_check(
         self,
         get_directories_to_analyze,
@@ -46,7 +48,7 @@ class CheckTest(unittest.TestCase):
         ) as call_client, patch.object(
             json, "loads", return_value=NO_ERROR_JSON_OUTPUT
         ):
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -66,7 +68,7 @@ class CheckTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
 
         shared_analysis_directory = MagicMock()
         shared_analysis_directory.get_root = lambda: "."
@@ -77,14 +79,14 @@ class CheckTest(unittest.TestCase):
         ), patch.object(
             shared_analysis_directory, "prepare"
         ) as prepare:
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
                 analysis_directory=shared_analysis_directory,
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
             prepare.assert_called_once_with()
 
     @patch(
@@ -95,7 +97,7 @@ class CheckTest(unittest.TestCase):
     @patch("os.path.realpath")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_sequential_check(
         self, directories_to_analyze, realpath, check_output, find_global_and_local_root
     ) -> None:
@@ -110,7 +112,7 @@ class CheckTest(unittest.TestCase):
         ) as call_client, patch.object(
             json, "loads", return_value=NO_ERROR_JSON_OUTPUT
         ):
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -131,13 +133,11 @@ class CheckTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
 
     @patch("subprocess.check_output")
     @patch("os.path.realpath")
-    @patch.object(
-        commands.Reporting, "_get_directories_to_analyze", return_value={"a", "b"}
-    )
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value={"a", "b"})
     @patch(
         f"{find_directories.__name__}.find_global_and_local_root",
         return_value=find_directories.FoundRoot(Path(".")),
@@ -156,7 +156,7 @@ class CheckTest(unittest.TestCase):
         ) as call_client, patch.object(
             json, "loads", return_value=NO_ERROR_JSON_OUTPUT
         ):
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -179,7 +179,7 @@ class CheckTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
 
     @patch(
         f"{find_directories.__name__}.find_global_and_local_root",
@@ -189,7 +189,7 @@ class CheckTest(unittest.TestCase):
     @patch("os.path.realpath")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_check_dumb_terminal(
         self, directories_to_analyze, realpath, check_output, find_global_and_local_root
     ) -> None:
@@ -204,7 +204,7 @@ class CheckTest(unittest.TestCase):
         ) as call_client, patch.object(
             json, "loads", return_value=NO_ERROR_JSON_OUTPUT
         ):
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -225,7 +225,7 @@ class CheckTest(unittest.TestCase):
             )
             exit_code = command.run().exit_code()
             self.assertEqual(exit_code, 0)
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
 
     @patch(
         f"{find_directories.__name__}.find_global_and_local_root",
@@ -235,7 +235,7 @@ class CheckTest(unittest.TestCase):
     @patch("os.path.realpath")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_check_strict(
         self, directories_to_analyze, realpath, check_output, find_global_and_local_root
     ) -> None:
@@ -251,7 +251,7 @@ class CheckTest(unittest.TestCase):
         ) as call_client, patch.object(
             json, "loads", return_value=NO_ERROR_JSON_OUTPUT
         ):
-            command = commands.Check(
+            command = Check(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -272,4 +272,4 @@ class CheckTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Check.NAME)
+            call_client.assert_called_once_with(command=Check.NAME)
@@ -17,6 +17,7 @@ from ...analysis_directory import AnalysisDirectory, SharedAnalysisDirectory
 from ...commands import command, incremental, stop  # noqa
 from ...socket_connection import SocketConnection
 from ..command import IncrementalStyle
+from ..incremental import Incremental
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -143,7 +144,7 @@ class IncrementalTest(unittest.TestCase):
         with patch.object(SocketConnection, "connect") as connect, patch.object(
             json, "loads", return_value=[]
         ):
-            test_command = commands.Incremental(
+            test_command = Incremental(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -219,7 +220,7 @@ class IncrementalTest(unittest.TestCase):
         with patch.object(SocketConnection, "connect") as connect, patch.object(
             json, "loads", return_value=[]
         ):
-            test_command = commands.Incremental(
+            test_command = Incremental(
                 arguments,
                 original_directory,
                 configuration=configuration,
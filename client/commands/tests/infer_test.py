@@ -29,6 +29,7 @@ from ...commands.infer import (
     generate_stub_files,
 )
 from ...error import LegacyError
+from ..reporting import Reporting
 from .command_test import (
     mock_arguments,
     mock_configuration as general_mock_configuration,
@@ -679,7 +680,7 @@ class InferTest(unittest.TestCase):
     @patch.object(json, "loads", return_value={"errors": []})
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_infer(
         self, directories_to_analyze, json_loads, find_global_and_local_root
     ) -> None:
@@ -716,7 +717,7 @@ class InferTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Infer.NAME)
+            call_client.assert_called_once_with(command=Infer.NAME)
 
         with patch.object(commands.Command, "_call_client") as call_client:
 
@@ -747,7 +748,7 @@ class InferTest(unittest.TestCase):
                 ],
             )
             command.run()
-            call_client.assert_called_once_with(command=commands.Infer.NAME)
+            call_client.assert_called_once_with(command=Infer.NAME)
 
         with patch.object(commands.Command, "_call_client") as call_client:
             with patch.object(sys.stdin, "read", return_value=""):
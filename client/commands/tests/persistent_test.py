@@ -10,15 +10,17 @@ from unittest.mock import MagicMock, call, patch
 
 from ... import commands, configuration_monitor, project_files_monitor
 from ...analysis_directory import AnalysisDirectory
+from ..persistent import Persistent
+from ..reporting import Reporting
 from .command_test import mock_arguments, mock_configuration
 
 
 class PersistentTest(unittest.TestCase):
     @patch.object(project_files_monitor, "ProjectFilesMonitor")
-    @patch.object(commands.Persistent, "run_null_server", return_value=None)
+    @patch.object(Persistent, "run_null_server", return_value=None)
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     @patch.object(configuration_monitor.ConfigurationMonitor, "daemonize")
     def test_persistent(
         self,
@@ -37,7 +39,7 @@ class PersistentTest(unittest.TestCase):
                     {"click_to_fix": True, "go_to_definition": True, "hover": True}
                 )
             )
-            command = commands.Persistent(
+            command = Persistent(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -59,14 +61,11 @@ class PersistentTest(unittest.TestCase):
             )
             command.run()
             call_client.assert_has_calls(
-                [
-                    call(command=commands.Persistent.NAME, capture_output=False),
-                    call().check(),
-                ]
+                [call(command=Persistent.NAME, capture_output=False), call().check()]
             )
 
         # Check null server initialize output
-        command = commands.Persistent(
+        command = Persistent(
             mock_arguments(),
             original_directory,
             configuration=configuration,
@@ -108,7 +107,7 @@ class PersistentTest(unittest.TestCase):
 
         select.return_value = ([stdin], [], [])
         # Check null server output when a valid input is given.
-        commands.Persistent.run_null_server(timeout=0)
+        Persistent.run_null_server(timeout=0)
         json = '{"id": 0, "jsonrpc": "2.0", "result": {"capabilities": {}}}'
         self.assertEqual(
             stdout.getvalue(), "Content-Length: 59\r\n\r\n{}\r\n".format(json)
@@ -10,11 +10,12 @@ from unittest.mock import MagicMock, patch
 from ... import commands
 from ...analysis_directory import AnalysisDirectory
 from ...socket_connection import SocketConnection
+from ..query import Query
 from .command_test import mock_arguments, mock_configuration
 
 
 class QueryTest(unittest.TestCase):
-    @patch.object(commands.Query, "_state")
+    @patch.object(Query, "_state")
     @patch.object(SocketConnection, "connect")
     @patch.object(AnalysisDirectory, "acquire_shared_reader_lock")
     def test_query(
@@ -29,7 +30,7 @@ class QueryTest(unittest.TestCase):
 
         state.return_value = commands.command.State.RUNNING
 
-        query_command = commands.Query(
+        query_command = Query(
             arguments,
             original_directory,
             configuration=configuration,
@@ -40,7 +41,7 @@ class QueryTest(unittest.TestCase):
         connect.assert_called_once()
         acquire_shared_reader_lock.assert_called_once()
         self.assertEqual(
-            commands.Query(
+            Query(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -54,7 +55,7 @@ class QueryTest(unittest.TestCase):
         connect.reset_mock()
         acquire_shared_reader_lock.reset_mock()
         state.return_value = commands.command.State.DEAD
-        query_command = commands.Query(
+        query_command = Query(
             arguments,
             original_directory,
             configuration=configuration,
@@ -75,7 +76,7 @@ class QueryTest(unittest.TestCase):
             "/root/a.py": "/shared/a.py",
             "/root/b.py": "/shared/b.py",
         }
-        query = commands.Query(
+        query = Query(
             arguments,
             original_directory,
             configuration=configuration,
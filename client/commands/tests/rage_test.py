@@ -13,6 +13,7 @@ from ... import commands, filesystem, recently_used_configurations
 from ...analysis_directory import AnalysisDirectory
 from ...commands.command import Result
 from ...commands.rage import Rage
+from ..servers import Servers
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -132,7 +133,7 @@ class RageTest(unittest.TestCase):
             self.assert_output(output_content)
 
     @patch.object(recently_used_configurations.Cache, "get_all_items")
-    @patch.object(commands.Servers, "is_root_server_running", return_value=True)
+    @patch.object(Servers, "is_root_server_running", return_value=True)
     @patch.object(commands.Command, "_call_client")
     def test_call_client_for_root_project__root_server_running(
         self,
@@ -158,7 +159,7 @@ class RageTest(unittest.TestCase):
     # pyre-fixme[56]: Argument `[]` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
     @patch.object(recently_used_configurations.Cache, "get_all_items", return_value=[])
-    @patch.object(commands.Servers, "is_root_server_running", return_value=False)
+    @patch.object(Servers, "is_root_server_running", return_value=False)
     @patch.object(commands.Command, "_call_client")
     def test_call_client_for_root_project__no_root_server_or_recent_local_roots(
         self,
@@ -186,7 +187,7 @@ class RageTest(unittest.TestCase):
         "get_all_items",
         return_value=["foo", "bar/baz"],
     )
-    @patch.object(commands.Servers, "is_root_server_running", return_value=False)
+    @patch.object(Servers, "is_root_server_running", return_value=False)
     @patch.object(commands.Command, "_call_client", autospec=True)
     def test_call_client_for_root_project__recent_local_roots(
         self,
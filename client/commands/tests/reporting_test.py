@@ -14,9 +14,10 @@ from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import MagicMock, mock_open, patch
 
-from ... import commands, find_directories
+from ... import find_directories
 from ...analysis_directory import AnalysisDirectory, SharedAnalysisDirectory
 from ..command import ClientException
+from ..reporting import Reporting
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -52,7 +53,7 @@ class ReportingTest(unittest.TestCase):
             ]
         }
 
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("/root/f/g")
         )
         with patch.object(json, "loads", return_value=copy.deepcopy(json_errors)):
@@ -63,7 +64,7 @@ class ReportingTest(unittest.TestCase):
 
         arguments = mock_arguments(targets=["//f/g:target"])
         configuration.targets = []
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("/root/f/g")
         )
         with patch.object(json, "loads", return_value=copy.deepcopy(json_errors)):
@@ -75,7 +76,7 @@ class ReportingTest(unittest.TestCase):
         original_directory = "/f/g/target"
         arguments = mock_arguments(targets=["//f/g:target"])
         configuration.targets = []
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("/root/h/i")
         )
         with patch.object(json, "loads", return_value=copy.deepcopy(json_errors)):
@@ -89,7 +90,7 @@ class ReportingTest(unittest.TestCase):
         find_global_and_local_root.return_value = find_directories.FoundRoot(
             Path("/root"), Path("/root/test")
         )  # project root
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("/root")
         )
         with patch.object(json, "loads", return_value=copy.deepcopy(json_errors)):
@@ -103,7 +104,7 @@ class ReportingTest(unittest.TestCase):
         find_global_and_local_root.return_value = find_directories.FoundRoot(
             Path("/root"), Path("/root/test")
         )  # project root
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments,
             original_directory,
             configuration,
@@ -124,7 +125,7 @@ class ReportingTest(unittest.TestCase):
         original_directory = "/"  # called from
         find_global_and_local_root.return_value = find_directories.FoundRoot(Path("/"))
         configuration.ignore_all_errors = ["*/b"]
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("/a")
         )
         json_errors["errors"][0]["path"] = "b/c.py"
@@ -140,7 +141,7 @@ class ReportingTest(unittest.TestCase):
     def test_load_errors_from_json(self, loads: MagicMock) -> None:
         error_list = [{"one": 1}, {"two": 2}]
         loads.return_value = {"errors": error_list}
-        actual = commands.Reporting._load_errors_from_json("<some json string>")
+        actual = Reporting._load_errors_from_json("<some json string>")
         self.assertEqual(actual, error_list)
 
     # pyre-fixme[56]: Argument `json` to decorator factory
@@ -149,7 +150,7 @@ class ReportingTest(unittest.TestCase):
     def test_load_errors_from_json_unexpected_format(self, loads: MagicMock) -> None:
         error_list = [{"one": 1}, {"two": 2}]
         loads.return_value = {"response": {"errors": error_list}}
-        actual = commands.Reporting._load_errors_from_json("<some json string>")
+        actual = Reporting._load_errors_from_json("<some json string>")
         self.assertEqual(actual, [])
 
     # pyre-fixme[56]: Argument `json` to decorator factory
@@ -159,7 +160,7 @@ class ReportingTest(unittest.TestCase):
         error_list = [{"one": 1}, {"two": 2}]
         loads.return_value = error_list
         # It expects a dictionary, not a list.
-        actual = commands.Reporting._load_errors_from_json("<some json string>")
+        actual = Reporting._load_errors_from_json("<some json string>")
         self.assertEqual(actual, [])
 
     # pyre-fixme[56]: Argument `json` to decorator factory
@@ -171,7 +172,7 @@ class ReportingTest(unittest.TestCase):
 
         loads.side_effect = raise_error
         with self.assertRaises(ClientException):
-            commands.Reporting._load_errors_from_json("<some json string>")
+            Reporting._load_errors_from_json("<some json string>")
 
     @patch.object(subprocess, "run")
     # pyre-fixme[56]: Pyre was not able to infer the type of argument
@@ -185,7 +186,7 @@ class ReportingTest(unittest.TestCase):
         )
         arguments = mock_arguments(source_directories=["base"])
         configuration = mock_configuration()
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("base")
         )
         run.return_value = subprocess.CompletedProcess(
@@ -202,14 +203,14 @@ class ReportingTest(unittest.TestCase):
             self.assertEqual(handler._get_directories_to_analyze(), {"base"})
 
         configuration.local_configuration = "a/b/.pyre_configuration.local"
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments, original_directory, configuration, AnalysisDirectory("base")
         )
         self.assertEqual(handler._get_directories_to_analyze(), {"base"})
 
         configuration.local_configuration = "a/b/.pyre_configuration.local"
         arguments = mock_arguments(source_directories=[])
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments,
             original_directory,
             configuration,
@@ -220,7 +221,7 @@ class ReportingTest(unittest.TestCase):
         # With no local configuration, no filter paths, and a shared analysis
         # directory, fall back on the pyre root (current directory).
         configuration.local_configuration = None
-        handler = commands.Reporting(
+        handler = Reporting(
             arguments,
             original_directory,
             configuration,
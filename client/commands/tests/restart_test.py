@@ -12,6 +12,7 @@ from ... import commands, configuration_monitor, project_files_monitor
 from ...analysis_directory import AnalysisDirectory
 from ...commands import restart
 from ..command import IncrementalStyle
+from ..restart import Restart
 from .command_test import mock_arguments, mock_configuration
 
 
@@ -40,7 +41,7 @@ class RestartTest(unittest.TestCase):
 
         commands_Stop().run().exit_code.return_value = commands.ExitCode.SUCCESS
 
-        commands.Restart(
+        Restart(
             arguments,
             original_directory,
             configuration=configuration,
@@ -72,7 +73,7 @@ class RestartTest(unittest.TestCase):
         commands_Stop.reset_mock()
         commands_Incremental.reset_mock()
         commands_Stop().run().exit_code.return_value = commands.ExitCode.FAILURE
-        commands.Restart(
+        Restart(
             arguments,
             original_directory,
             configuration=configuration,
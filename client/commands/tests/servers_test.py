@@ -9,7 +9,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
-from ... import command_arguments, commands, configuration as configuration_module, log
+from ... import command_arguments, configuration as configuration_module, log
 from ...analysis_directory import AnalysisDirectory
 from .. import servers
 from ..servers import ServerDetails, Servers
@@ -19,7 +19,7 @@ from .command_test import mock_arguments, mock_configuration
 class ServersCommandTest(unittest.TestCase):
     @patch.object(log.stdout, "write")
     def test_print_server_details(self, log_stdout: MagicMock) -> None:
-        commands.Servers._print_server_details(
+        Servers._print_server_details(
             [
                 ServerDetails(
                     pid=789,
@@ -49,7 +49,7 @@ class ServersCommandTest(unittest.TestCase):
         )
 
         log_stdout.reset_mock()
-        commands.Servers._print_server_details(
+        Servers._print_server_details(
             [
                 ServerDetails(
                     pid=789,
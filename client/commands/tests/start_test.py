@@ -19,6 +19,7 @@ from ... import (
 )
 from ...analysis_directory import AnalysisDirectory
 from ..command import ExitCode
+from ..reporting import Reporting
 from ..start import Start
 from .command_test import mock_arguments, mock_configuration
 
@@ -31,7 +32,7 @@ class StartTest(unittest.TestCase):
     @patch("fcntl.lockf")
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     @patch.object(configuration_monitor.ConfigurationMonitor, "daemonize")
     def test_start(
         self,
@@ -178,7 +179,7 @@ class StartTest(unittest.TestCase):
     )
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_start_flags(
         self, get_directories_to_analyze, find_global_and_local_root
     ) -> None:
@@ -459,7 +460,7 @@ class StartTest(unittest.TestCase):
     )
     # pyre-fixme[56]: Argument `set()` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
-    @patch.object(commands.Reporting, "_get_directories_to_analyze", return_value=set())
+    @patch.object(Reporting, "_get_directories_to_analyze", return_value=set())
     def test_start_flags__ignore_all_errors(
         self,
         get_directories_to_analyze: MagicMock,
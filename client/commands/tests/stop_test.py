@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 from ... import commands, watchman
 from ...analysis_directory import AnalysisDirectory
+from ..kill import Kill
 from ..stop import Stop
 from .command_test import mock_arguments, mock_configuration
 
@@ -25,7 +26,7 @@ def _mark_processes_as_completed(process_id: int, signal: int) -> None:
 @patch.object(os, "kill", side_effect=_mark_processes_as_completed)
 @patch.object(watchman, "stop_subscriptions")
 @patch.object(commands.stop, "open", side_effect=lambda filename: StringIO("42"))
-@patch.object(commands.Kill, "_run")
+@patch.object(Kill, "_run")
 @patch.object(commands.Command, "_state")
 class StopTest(unittest.TestCase):
     def setUp(self) -> None:
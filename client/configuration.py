@@ -7,6 +7,7 @@
 
 import abc
 import dataclasses
+import functools
 import glob
 import hashlib
 import json
@@ -22,12 +23,14 @@ from logging import Logger
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -212,6 +215,13 @@ def create_search_paths(
     raise InvalidConfiguration(f"Invalid search path element: {json}")
 
 
+def query_binary_version(binary: str) -> Optional[str]:
+    status = subprocess.run(
+        [binary, "-version"], stdout=subprocess.PIPE, universal_newlines=True
+    )
+    return status.stdout.strip() if status.returncode == 0 else None
+
+
 def assert_readable_directory_in_configuration(
     directory: str, field_name: str = ""
 ) -> None:
@@ -269,12 +279,12 @@ class PartialConfiguration:
         arguments: command_arguments.CommandArguments,
     ) -> "PartialConfiguration":
         strict: Optional[bool] = True if arguments.strict else None
-        source_directories: Optional[List[str]] = (
+        source_directories: Optional[Sequence[str]] = (
             arguments.source_directories
             if len(arguments.source_directories) > 0
             else None
         )
-        targets: Optional[List[str]] = (
+        targets: Optional[Sequence[str]] = (
             arguments.targets if len(arguments.targets) > 0 else None
         )
         return PartialConfiguration(
@@ -455,11 +465,7 @@ class PartialConfiguration:
 
     @staticmethod
     def from_file(path: Path) -> "PartialConfiguration":
-        try:
-            contents = path.read_text(encoding="utf-8")
-            return PartialConfiguration.from_string(contents)
-        except OSError as error:
-            raise InvalidConfiguration(f"Error when reading {path}: {error}")
+        return _read_partial_configuration(path)
 
     def expand_relative_paths(self, root: str) -> "PartialConfiguration":
         binary = self.binary
@@ -522,6 +528,49 @@ class PartialConfiguration:
         )
 
 
+def _get_modification_time(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cache_until_modified(
+    watched_files: Callable[..., Iterable[Path]]
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Memoizes a function of hashable arguments. A cached result is dropped as soon
+    as any of `watched_files(*arguments)` is created, modified or removed.
+    """
+
+    def decorator(function: Callable[..., T]) -> Callable[..., T]:
+        @functools.lru_cache(maxsize=16)
+        def cached(
+            arguments: Tuple[Any, ...], modification_times: Tuple[Optional[int], ...]
+        ) -> T:
+            return function(*arguments)
+
+        @functools.wraps(function)
+        def wrapper(*arguments: Any) -> T:
+            modification_times = tuple(
+                _get_modification_time(path) for path in watched_files(*arguments)
+            )
+            return cached(arguments, modification_times)
+
+        return wrapper
+
+    return decorator
+
+
+@_cache_until_modified(lambda path: [path])
+def _read_partial_configuration(path: Path) -> PartialConfiguration:
+    try:
+        contents = path.read_text(encoding="utf-8")
+        return PartialConfiguration.from_string(contents)
+    except OSError as error:
+        raise InvalidConfiguration(f"Error when reading {path}: {error}")
+
+
 def merge_partial_configurations(
     base: PartialConfiguration, override: PartialConfiguration
 ) -> PartialConfiguration:
@@ -795,10 +844,7 @@ class Configuration:
         binary = self.get_binary_respecting_override()
         if binary is None:
             return None
-        status = subprocess.run(
-            [binary, "-version"], stdout=subprocess.PIPE, universal_newlines=True
-        )
-        return status.stdout.strip() if status.returncode == 0 else None
+        return query_binary_version(binary)
 
     def get_number_of_workers(self) -> int:
         number_of_workers = self.number_of_workers
@@ -839,41 +885,59 @@ class Configuration:
 
 
 def create_configuration(
-    arguments: command_arguments.CommandArguments, base_directory: Path
+    arguments: command_arguments.CommandArguments,
+    base_directory: Path,
+    local_configuration_override: Optional[str] = None,
 ) -> Configuration:
-    local_root_argument = arguments.local_configuration
+    local_root_argument = (
+        arguments.local_configuration
+        if local_configuration_override is None
+        else local_configuration_override
+    )
     found_root = find_directories.find_global_and_local_root(
         base_directory
         if local_root_argument is None
         else base_directory / local_root_argument
     )
-
-    command_argument_configuration = PartialConfiguration.from_command_arguments(
-        arguments
-    )
     if found_root is None:
-        project_root = Path.cwd()
-        relative_local_root = None
-        partial_configuration = command_argument_configuration
-    else:
-        project_root = found_root.global_root
-        relative_local_root = None
-        partial_configuration = PartialConfiguration.from_file(
-            project_root / CONFIGURATION_FILE
-        ).expand_relative_paths(str(project_root))
-        local_root = found_root.local_root
-        if local_root is not None:
-            relative_local_root = get_relative_local_root(project_root, local_root)
-            partial_configuration = merge_partial_configurations(
-                base=partial_configuration,
-                override=PartialConfiguration.from_file(
-                    local_root / LOCAL_CONFIGURATION_FILE
-                ).expand_relative_paths(str(local_root)),
-            )
-        partial_configuration = merge_partial_configurations(
-            base=partial_configuration, override=command_argument_configuration
+        return Configuration.from_partial_configuration(
+            Path.cwd(), None, PartialConfiguration.from_command_arguments(arguments)
         )
+    return _create_configuration_from_root(arguments, found_root)
+
+
+def _get_root_configuration_files(
+    arguments: command_arguments.CommandArguments,
+    found_root: find_directories.FoundRoot,
+) -> Iterable[Path]:
+    yield found_root.global_root / CONFIGURATION_FILE
+    if found_root.local_root is not None:
+        yield found_root.local_root / LOCAL_CONFIGURATION_FILE
+
 
+@_cache_until_modified(_get_root_configuration_files)
+def _create_configuration_from_root(
+    arguments: command_arguments.CommandArguments,
+    found_root: find_directories.FoundRoot,
+) -> Configuration:
+    project_root = found_root.global_root
+    relative_local_root = None
+    partial_configuration = PartialConfiguration.from_file(
+        project_root / CONFIGURATION_FILE
+    ).expand_relative_paths(str(project_root))
+    local_root = found_root.local_root
+    if local_root is not None:
+        relative_local_root = get_relative_local_root(project_root, local_root)
+        partial_configuration = merge_partial_configurations(
+            base=partial_configuration,
+            override=PartialConfiguration.from_file(
+                local_root / LOCAL_CONFIGURATION_FILE
+            ).expand_relative_paths(str(local_root)),
+        )
+    partial_configuration = merge_partial_configurations(
+        base=partial_configuration,
+        override=PartialConfiguration.from_command_arguments(arguments),
+    )
     return Configuration.from_partial_configuration(
         project_root, relative_local_root, partial_configuration
     )
@@ -187,6 +187,16 @@ def initialize(noninteractive: bool) -> None:
     if __handler:
         LOG.debug("Log handler already exists, skipping initialization.")
         return
+
+    logging.addLevelName(PERFORMANCE, "PERFORMANCE")
+    logging.addLevelName(PROMPT, "PROMPT")
+    logging.addLevelName(SUCCESS, "SUCCESS")
+
+    if logging.getLogger().handlers:
+        # `basicConfig` would ignore a new handler anyway, so avoid creating one
+        # (and starting its thread) when a previous invocation configured logging.
+        LOG.debug("Logging is already configured, skipping initialization.")
+        return
     if noninteractive:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(SectionFormatter())
@@ -196,10 +206,6 @@ def initialize(noninteractive: bool) -> None:
         stream_handler = TimedStreamHandler()
         __handler = stream_handler
 
-    logging.addLevelName(PERFORMANCE, "PERFORMANCE")
-    logging.addLevelName(PROMPT, "PROMPT")
-    logging.addLevelName(SUCCESS, "SUCCESS")
-
     logging.basicConfig(level=logging.DEBUG, handlers=[stream_handler])
 
 
@@ -4,16 +4,17 @@
 # LICENSE file in the root directory of this source tree.
 
 
+import atexit
+import functools
 import json
 import logging
 import os
-import shutil
 import sys
+import threading
 import time
 import traceback
-from dataclasses import replace
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import click
 
@@ -24,17 +25,39 @@ from . import (
     configuration as configuration_module,
     filesystem,
     log,
-    recently_used_configurations,
-    statistics as statistics_module,
 )
-from .commands import Command, ExitCode, v2
-from .commands.analyze import MissingFlowsKind
+from .commands import Command, ExitCode, MissingFlowsKind
 from .exceptions import EnvironmentException
 from .version import __version__
 
 
 LOG: logging.Logger = logging.getLogger(__name__)
 
+_INCREMENTAL_STYLES: Dict[str, commands.IncrementalStyle] = {
+    str(style): style for style in commands.IncrementalStyle
+}
+_PROFILE_OUTPUTS: Dict[str, commands.ProfileOutput] = {
+    str(output): output for output in commands.ProfileOutput
+}
+
+# Upper bound on how long process exit waits for pending statistics to be logged.
+_STATISTICS_FLUSH_TIMEOUT_SECONDS: float = 2.0
+_STATISTICS_THREADS: List[threading.Thread] = []
+
+
+def _flush_statistics(
+    timeout_seconds: float = _STATISTICS_FLUSH_TIMEOUT_SECONDS,
+) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while _STATISTICS_THREADS:
+        thread = _STATISTICS_THREADS.pop()
+        thread.join(max(deadline - time.monotonic(), 0))
+        if thread.is_alive():
+            LOG.debug("Timed out waiting for statistics to be logged.")
+
+
+atexit.register(_flush_statistics)
+
 
 def _log_statistics(
     command: Command,
@@ -45,24 +68,41 @@ def _log_statistics(
     should_log: bool = True,
 ) -> None:
     configuration = command.configuration
-    if should_log and configuration and configuration.logger:
-        statistics_module.log_with_configuration(
-            category=statistics_module.LoggerCategory.USAGE,
-            configuration=configuration,
-            integers={
+    if not (should_log and configuration and configuration.logger):
+        return
+
+    from . import statistics as statistics_module
+
+    # Logging shells out to the configured logger. Do it in the background so
+    # that it overlaps with shutdown, and only wait for it when the process exits.
+    thread = threading.Thread(
+        target=statistics_module.log_with_configuration,
+        kwargs={
+            "category": statistics_module.LoggerCategory.USAGE,
+            "configuration": configuration,
+            "integers": {
                 "exit_code": exit_code,
-                "runtime": int((time.time() - start_time) * 1000),
+                "runtime": int((time.monotonic() - start_time) * 1000),
             },
-            normals={
+            "normals": {
                 "project_root": configuration.project_root,
                 "root": configuration.relative_local_root,
-                "cwd": os.getcwd(),
+                "cwd": command.original_directory,
                 "client_version": __version__,
                 "command": command.NAME,
                 "client_exception": client_exception_message,
                 "error_message": error_message,
             },
-        )
+        },
+        daemon=True,
+    )
+    # Forget threads that are done so that long-lived processes do not hold on to
+    # every thread they ever started.
+    _STATISTICS_THREADS[:] = [
+        pending for pending in _STATISTICS_THREADS if pending.is_alive()
+    ]
+    _STATISTICS_THREADS.append(thread)
+    thread.start()
 
 
 def _show_pyre_version_as_text(
@@ -83,12 +123,23 @@ def _show_pyre_version_as_json(
     log.stdout.write(f"{json.dumps(version_json)}\n")
 
 
-def _show_pyre_version(arguments: command_arguments.CommandArguments) -> None:
+def _show_pyre_version(
+    arguments: command_arguments.CommandArguments, base_directory: Path
+) -> None:
     binary_version: Optional[str] = None
     client_version: str = __version__
     try:
-        configuration = configuration_module.create_configuration(arguments, Path("."))
-        binary_version = configuration.get_binary_version()
+        if arguments.binary is not None:
+            # An explicit binary overrides any configuration, so there is no need
+            # to look for one.
+            binary_version = configuration_module.query_binary_version(
+                arguments.binary
+            )
+        else:
+            configuration = configuration_module.create_configuration(
+                arguments, base_directory
+            )
+            binary_version = configuration.get_binary_version()
     except Exception:
         pass
     if arguments.output == command_arguments.JSON:
@@ -102,7 +153,7 @@ def run_pyre_command(
     configuration: configuration_module.Configuration,
     noninteractive: bool,
 ) -> ExitCode:
-    start_time = time.time()
+    start_time = time.monotonic()
 
     client_exception_message = ""
     should_log_statistics = True
@@ -113,24 +164,30 @@ def run_pyre_command(
         configuration_module.check_nested_local_configuration(configuration)
         log.start_logging_to_directory(noninteractive, configuration.log_directory)
         exit_code = command.run().exit_code()
-    except (buck.BuckException, EnvironmentException) as error:
-        client_exception_message = str(error)
-        exit_code = ExitCode.FAILURE
+    except BaseException as error:
         if isinstance(error, buck.BuckException):
+            client_exception_message = str(error)
             exit_code = ExitCode.BUCK_ERROR
-    except (
-        commands.ClientException,
-        configuration_module.InvalidConfiguration,
-    ) as error:
-        client_exception_message = str(error)
-        exit_code = ExitCode.FAILURE
-    except Exception:
-        client_exception_message = traceback.format_exc()
-        exit_code = ExitCode.FAILURE
-    except KeyboardInterrupt:
-        LOG.warning("Interrupted by user")
-        LOG.debug(traceback.format_exc())
-        exit_code = ExitCode.SUCCESS
+        elif isinstance(
+            error,
+            (
+                EnvironmentException,
+                commands.ClientException,
+                configuration_module.InvalidConfiguration,
+            ),
+        ):
+            client_exception_message = str(error)
+            exit_code = ExitCode.FAILURE
+        elif isinstance(error, KeyboardInterrupt):
+            LOG.warning("Interrupted by user")
+            LOG.debug(traceback.format_exc())
+            exit_code = ExitCode.SUCCESS
+        elif isinstance(error, Exception):
+            client_exception_message = traceback.format_exc()
+            exit_code = ExitCode.FAILURE
+        else:
+            # Let `SystemExit` and `GeneratorExit` propagate as before.
+            raise
     finally:
         if len(client_exception_message) > 0:
             LOG.error(client_exception_message)
@@ -148,26 +205,76 @@ def run_pyre_command(
     return exit_code
 
 
-def _run_check_command(arguments: command_arguments.CommandArguments) -> ExitCode:
-    configuration = _create_configuration_with_retry(arguments, Path("."))
+def _run_command(
+    command_class: Callable[..., Command],
+    arguments: command_arguments.CommandArguments,
+    original_directory: str,
+    configuration: configuration_module.Configuration,
+    noninteractive: Optional[bool] = None,
+    **kwargs: object,
+) -> ExitCode:
     return run_pyre_command(
-        commands.Check(
-            arguments, original_directory=os.getcwd(), configuration=configuration
+        command_class(
+            arguments,
+            original_directory=original_directory,
+            configuration=configuration,
+            **kwargs,
         ),
         configuration,
-        arguments.noninteractive,
+        arguments.noninteractive if noninteractive is None else noninteractive,
+    )
+
+
+def _dispatch(
+    context: click.Context,
+    command_class: Callable[..., Command],
+    with_retry: bool = True,
+    noninteractive: Optional[bool] = None,
+    **kwargs: object,
+) -> ExitCode:
+    arguments: command_arguments.CommandArguments = context.obj["arguments"]
+    original_directory: str = context.obj["cwd"]
+    create_configuration = (
+        _create_configuration_with_retry
+        if with_retry
+        else configuration_module.create_configuration
+    )
+    configuration = create_configuration(arguments, Path(original_directory))
+    return _run_command(
+        command_class,
+        arguments,
+        original_directory,
+        configuration,
+        noninteractive,
+        **kwargs,
     )
 
 
+def _run_check_command(
+    arguments: command_arguments.CommandArguments, original_directory: str
+) -> ExitCode:
+    from .commands.check import Check
+
+    configuration = _create_configuration_with_retry(
+        arguments, Path(original_directory)
+    )
+    return _run_command(Check, arguments, original_directory, configuration)
+
+
 def _run_incremental_command(
     arguments: command_arguments.CommandArguments,
+    original_directory: str,
     nonblocking: bool,
     incremental_style: commands.IncrementalStyle,
     no_start_server: bool,
     no_watchman: bool,
 ) -> ExitCode:
-    configuration = _create_configuration_with_retry(arguments, Path("."))
+    configuration = _create_configuration_with_retry(
+        arguments, Path(original_directory)
+    )
     if arguments.use_command_v2:
+        from .commands.v2 import incremental as v2_incremental
+
         start_arguments = command_arguments.StartArguments(
             changed_files_path=arguments.changed_files_path,
             debug=arguments.debug,
@@ -182,7 +289,7 @@ def _run_incremental_command(
             terminal=False,
             wait_on_initialization=True,
         )
-        return v2.incremental.run(
+        return v2_incremental.run(
             configuration,
             command_arguments.IncrementalArguments(
                 output=arguments.output,
@@ -191,25 +298,34 @@ def _run_incremental_command(
             ),
         )
     else:
-        return run_pyre_command(
-            commands.Incremental(
-                arguments,
-                original_directory=os.getcwd(),
-                configuration=configuration,
-                nonblocking=nonblocking,
-                incremental_style=incremental_style,
-                no_start_server=no_start_server,
-                no_watchman=no_watchman,
-            ),
+        from .commands.incremental import Incremental
+
+        return _run_command(
+            Incremental,
+            arguments,
+            original_directory,
             configuration,
-            arguments.noninteractive,
+            nonblocking=nonblocking,
+            incremental_style=incremental_style,
+            no_start_server=no_start_server,
+            no_watchman=no_watchman,
         )
 
 
-def _run_default_command(arguments: command_arguments.CommandArguments) -> ExitCode:
-    if shutil.which("watchman"):
+@functools.lru_cache(maxsize=4)
+def _watchman_path(search_path: str) -> Optional[str]:
+    import shutil
+
+    return shutil.which("watchman", path=search_path)
+
+
+def _run_default_command(
+    arguments: command_arguments.CommandArguments, original_directory: str
+) -> ExitCode:
+    if _watchman_path(os.environ.get("PATH", "")):
         return _run_incremental_command(
             arguments=arguments,
+            original_directory=original_directory,
             nonblocking=False,
             incremental_style=commands.IncrementalStyle.FINE_GRAINED,
             no_start_server=False,
@@ -219,11 +335,11 @@ def _run_default_command(arguments: command_arguments.CommandArguments) -> ExitC
         watchman_link = "https://facebook.github.io/watchman/docs/install"
         LOG.warning(
             "No watchman binary found. \n"
-            "To enable pyre incremental, "
-            "you can install watchman: {}".format(watchman_link)
+            "To enable pyre incremental, you can install watchman: %s\n"
+            "Defaulting to non-incremental check.",
+            watchman_link,
         )
-        LOG.warning("Defaulting to non-incremental check.")
-        return _run_check_command(arguments)
+        return _run_check_command(arguments, original_directory)
 
 
 def _create_configuration_with_retry(
@@ -237,6 +353,12 @@ def _create_configuration_with_retry(
     # and if there exists recently-used local configurations, we guess that
     # the user may have forgotten to specifiy `-l`.
     error_message = "No buck targets or source directories to analyze."
+    if not os.path.isdir(configuration.dot_pyre_directory):
+        # Nothing has been recorded as recently used if `.pyre` does not exist.
+        raise configuration_module.InvalidConfiguration(error_message)
+
+    from . import recently_used_configurations
+
     recently_used_local_roots = recently_used_configurations.Cache(
         configuration.dot_pyre_directory
     ).get_all_items()
@@ -252,13 +374,17 @@ def _create_configuration_with_retry(
             "Cannot determine which recent local root to rerun. "
         )
 
-    LOG.warning(f"Restarting pyre under local root `{local_root_for_rerun}`...")
     LOG.warning(
-        f"Hint: To avoid this prompt, run `pyre -l {local_root_for_rerun}` "
-        f"or `cd {local_root_for_rerun} && pyre`."
+        "Restarting pyre under local root `%s`...\n"
+        "Hint: To avoid this prompt, run `pyre -l %s` or `cd %s && pyre`.",
+        local_root_for_rerun,
+        local_root_for_rerun,
+        local_root_for_rerun,
     )
     new_configuration = configuration_module.create_configuration(
-        replace(arguments, local_configuration=local_root_for_rerun), base_directory
+        arguments,
+        base_directory,
+        local_configuration_override=local_root_for_rerun,
     )
     if (
         len(new_configuration.source_directories) > 0
@@ -268,6 +394,31 @@ def _create_configuration_with_retry(
     raise configuration_module.InvalidConfiguration(error_message)
 
 
+# Options shared by several subcommands.
+_OptionDecorator = Callable[[Callable[..., int]], Callable[..., int]]
+_terminal_option: _OptionDecorator = click.option(
+    "--terminal", is_flag=True, default=False, help="Run the server in the terminal."
+)
+_store_type_check_resolution_option: _OptionDecorator = click.option(
+    "--store-type-check-resolution",
+    is_flag=True,
+    default=False,
+    help="Store extra information for `types` queries.",
+)
+_no_watchman_option: _OptionDecorator = click.option(
+    "--no-watchman",
+    is_flag=True,
+    default=False,
+    help="Do not spawn a watchman client in the background.",
+)
+_incremental_style_option: _OptionDecorator = click.option(
+    "--incremental-style",
+    type=click.Choice(list(_INCREMENTAL_STYLES)),
+    default=str(commands.IncrementalStyle.FINE_GRAINED),
+    help="[DEPRECATED] How to approach doing incremental checks.",
+)
+
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 @click.option(
@@ -390,7 +541,7 @@ def pyre(
     debug: bool,
     sequential: Optional[bool],
     strict: Optional[bool],
-    additional_check: Iterable[str],
+    additional_check: Tuple[str, ...],
     show_error_traces: bool,
     output: str,
     enable_profiling: bool,
@@ -401,17 +552,17 @@ def pyre(
     dot_pyre_directory: Optional[str],
     logger: Optional[str],
     formatter: Optional[str],
-    target: Iterable[str],
+    target: Tuple[str, ...],
     use_buck_builder: Optional[bool],
     buck_mode: Optional[str],
     use_buck_source_database: Optional[bool],
-    source_directory: Iterable[str],
+    source_directory: Tuple[str, ...],
     filter_directory: Optional[str],
     no_saved_state: bool,
-    search_path: Iterable[str],
+    search_path: Tuple[str, ...],
     binary: Optional[str],
     buck_builder_binary: Optional[str],
-    exclude: Iterable[str],
+    exclude: Tuple[str, ...],
     typeshed: Optional[str],
     save_initial_state_to: Optional[str],
     load_initial_state_from: Optional[str],
@@ -427,7 +578,7 @@ def pyre(
         debug=debug,
         sequential=sequential or False,
         strict=strict or False,
-        additional_checks=list(additional_check),
+        additional_checks=additional_check,
         show_error_traces=show_error_traces,
         output=output,
         enable_profiling=enable_profiling,
@@ -437,17 +588,17 @@ def pyre(
         log_identifier=log_identifier,
         logger=logger,
         formatter=formatter,
-        targets=list(target),
+        targets=target,
         use_buck_builder=use_buck_builder,
         use_buck_source_database=use_buck_source_database,
-        source_directories=list(source_directory),
+        source_directories=source_directory,
         filter_directory=filter_directory,
         buck_mode=buck_mode,
         no_saved_state=no_saved_state,
-        search_path=list(search_path),
+        search_path=search_path,
         binary=binary,
         buck_builder_binary=buck_builder_binary,
-        exclude=list(exclude),
+        exclude=exclude,
         typeshed=typeshed,
         save_initial_state_to=save_initial_state_to,
         load_initial_state_from=load_initial_state_from,
@@ -460,15 +611,18 @@ def pyre(
         use_command_v2=use_command_v2,
         isolation_prefix=isolation_prefix,
     )
+    context.ensure_object(dict)
+    if "cwd" not in context.obj:
+        context.obj["cwd"] = os.getcwd()
+
     if arguments.version:
-        _show_pyre_version(arguments)
+        _show_pyre_version(arguments, Path(context.obj["cwd"]))
         return ExitCode.SUCCESS
 
-    context.ensure_object(dict)
     context.obj["arguments"] = arguments
 
     if context.invoked_subcommand is None:
-        return _run_default_command(arguments)
+        return _run_default_command(arguments, context.obj["cwd"])
 
     # This return value is not used anywhere.
     return ExitCode.SUCCESS
@@ -530,31 +684,26 @@ def analyze(
     """
     Run Pysa, the inter-procedural static analysis tool.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
+    from .commands.analyze import Analyze
+
     rules = list(rule)
-    return run_pyre_command(
-        commands.Analyze(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            analysis=analysis,
-            taint_models_path=list(taint_models_path),
-            no_verify=no_verify,
-            save_results_to=save_results_to,
-            dump_call_graph=dump_call_graph,
-            repository_root=repository_root,
-            rules=list(rules) if len(rules) > 0 else None,
-            find_missing_flows=(
-                MissingFlowsKind(find_missing_flows)
-                if find_missing_flows is not None
-                else None
-            ),
-            dump_model_query_results=dump_model_query_results,
-            use_cache=use_cache,
+    return _dispatch(
+        context,
+        Analyze,
+        analysis=analysis,
+        taint_models_path=list(taint_models_path),
+        no_verify=no_verify,
+        save_results_to=save_results_to,
+        dump_call_graph=dump_call_graph,
+        repository_root=repository_root,
+        rules=list(rules) if len(rules) > 0 else None,
+        find_missing_flows=(
+            MissingFlowsKind(find_missing_flows)
+            if find_missing_flows is not None
+            else None
         ),
-        configuration,
-        command_argument.noninteractive,
+        dump_model_query_results=dump_model_query_results,
+        use_cache=use_cache,
     )
 
 
@@ -564,7 +713,7 @@ def check(context: click.Context) -> int:
     """
     Runs a one-time type check of a Python project.
     """
-    return _run_check_command(context.obj["arguments"])
+    return _run_check_command(context.obj["arguments"], context.obj["cwd"])
 
 
 @pyre.command()
@@ -577,17 +726,7 @@ def check(context: click.Context) -> int:
         "even if analysis is still in progress."
     ),
 )
-@click.option(
-    "--incremental-style",
-    type=click.Choice(
-        [
-            str(commands.IncrementalStyle.SHALLOW),
-            str(commands.IncrementalStyle.FINE_GRAINED),
-        ]
-    ),
-    default=str(commands.IncrementalStyle.FINE_GRAINED),
-    help="[DEPRECATED] How to approach doing incremental checks.",
-)
+@_incremental_style_option
 @click.option("--no-start", is_flag=True, default=False, hidden=True)
 # This is mostly to allow `restart` to pass on the flag to `start`.
 @click.option("--no-watchman", is_flag=True, default=False, hidden=True)
@@ -611,10 +750,11 @@ def incremental(
     command_argument: command_arguments.CommandArguments = context.obj["arguments"]
     return _run_incremental_command(
         arguments=command_argument,
+        original_directory=context.obj["cwd"],
         nonblocking=nonblocking,
-        incremental_style=commands.IncrementalStyle.SHALLOW
-        if incremental_style == str(commands.IncrementalStyle.SHALLOW)
-        else commands.IncrementalStyle.FINE_GRAINED,
+        incremental_style=_INCREMENTAL_STYLES.get(
+            incremental_style, commands.IncrementalStyle.FINE_GRAINED
+        ),
         no_start_server=no_start,
         no_watchman=no_watchman,
     )
@@ -693,26 +833,21 @@ def infer(
     """
     Try adding type annotations to untyped codebase.
     """
+    from .commands.infer import Infer
+
     in_place_paths = list(modify_paths) if in_place else None
     full_stub_paths = list(modify_paths) if full_stubs else None
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
-    return run_pyre_command(
-        commands.Infer(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            print_errors=print_only,
-            full_only=full_only,
-            recursive=recursive,
-            in_place=in_place_paths,
-            errors_from_stdin=json,
-            annotate_from_existing_stubs=annotate_from_existing_stubs,
-            debug_infer=debug_infer,
-            full_stub_paths=full_stub_paths,
-        ),
-        configuration,
-        command_argument.noninteractive,
+    return _dispatch(
+        context,
+        Infer,
+        print_errors=print_only,
+        full_only=full_only,
+        recursive=recursive,
+        in_place=in_place_paths,
+        errors_from_stdin=json,
+        annotate_from_existing_stubs=annotate_from_existing_stubs,
+        debug_infer=debug_infer,
+        full_stub_paths=full_stub_paths,
     )
 
 
@@ -728,7 +863,9 @@ def init(context: click.Context, local: bool) -> int:
     """
     Create a pyre configuration file at the current directory.
     """
-    return commands.Initialize().run().exit_code()
+    from .commands.initialize import Initialize
+
+    return Initialize().run().exit_code()
 
 
 @pyre.command()
@@ -740,20 +877,9 @@ def kill(context: click.Context, with_fire: bool) -> int:
     """
     Force all running Pyre servers to terminate.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = configuration_module.create_configuration(
-        command_argument, Path(".")
-    )
-    return run_pyre_command(
-        commands.Kill(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            with_fire=with_fire,
-        ),
-        configuration,
-        command_argument.noninteractive,
-    )
+    from .commands.kill import Kill
+
+    return _dispatch(context, Kill, with_retry=False, with_fire=with_fire)
 
 
 @pyre.command()
@@ -765,26 +891,21 @@ def persistent(context: click.Context, no_watchman: bool) -> int:
     the Language Server Protocol, accepts input from stdin and writing diagnostics
     and responses from the Pyre server to stdout.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = configuration_module.create_configuration(
-        command_argument, Path(".")
-    )
-    return run_pyre_command(
-        commands.Persistent(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            no_watchman=no_watchman,
-        ),
-        configuration,
-        True,
+    from .commands.persistent import Persistent
+
+    return _dispatch(
+        context,
+        Persistent,
+        with_retry=False,
+        noninteractive=True,
+        no_watchman=no_watchman,
     )
 
 
 @pyre.command()
 @click.option(
     "--profile-output",
-    type=click.Choice([str(x) for x in commands.ProfileOutput]),
+    type=click.Choice(list(_PROFILE_OUTPUTS)),
     default=str(commands.ProfileOutput.COLD_START_PHASES),
     help="Specify what to output.",
 )
@@ -793,25 +914,13 @@ def profile(context: click.Context, profile_output: str) -> int:
     """
     Display profiling output.
     """
+    from .commands.profile import Profile
 
-    def get_profile_output(profile_output: str) -> commands.ProfileOutput:
-        for item in commands.ProfileOutput:
-            if str(item) == profile_output:
-                return item
+    output = _PROFILE_OUTPUTS.get(profile_output)
+    if output is None:
         raise ValueError(f"Unrecognized value for --profile-output: {profile_output}")
 
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
-    return run_pyre_command(
-        commands.Profile(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            profile_output=get_profile_output(profile_output),
-        ),
-        configuration,
-        command_argument.noninteractive,
-    )
+    return _dispatch(context, Profile, profile_output=output)
 
 
 @pyre.command()
@@ -826,18 +935,9 @@ def query(context: click.Context, query: str) -> int:
 
     To get a full list of queries, you can run `pyre query help`.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
-    return run_pyre_command(
-        commands.Query(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            query=query,
-        ),
-        configuration,
-        command_argument.noninteractive,
-    )
+    from .commands.query import Query
+
+    return _dispatch(context, Query, query=query)
 
 
 @pyre.command()
@@ -852,49 +952,16 @@ def rage(context: click.Context, output_file: str) -> int:
     Collects troubleshooting diagnostics for Pyre, and writes this information
     to the terminal or to a file.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = configuration_module.create_configuration(
-        command_argument, Path(".")
-    )
-    return run_pyre_command(
-        commands.Rage(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            output_path=output_file,
-        ),
-        configuration,
-        command_argument.noninteractive,
-    )
+    from .commands.rage import Rage
+
+    return _dispatch(context, Rage, with_retry=False, output_path=output_file)
 
 
 @pyre.command()
-@click.option(
-    "--terminal", is_flag=True, default=False, help="Run the server in the terminal."
-)
-@click.option(
-    "--store-type-check-resolution",
-    is_flag=True,
-    default=False,
-    help="Store extra information for `types` queries.",
-)
-@click.option(
-    "--no-watchman",
-    is_flag=True,
-    default=False,
-    help="Do not spawn a watchman client in the background.",
-)
-@click.option(
-    "--incremental-style",
-    type=click.Choice(
-        [
-            str(commands.IncrementalStyle.SHALLOW),
-            str(commands.IncrementalStyle.FINE_GRAINED),
-        ]
-    ),
-    default=str(commands.IncrementalStyle.FINE_GRAINED),
-    help="[DEPRECATED] How to approach doing incremental checks.",
-)
+@_terminal_option
+@_store_type_check_resolution_option
+@_no_watchman_option
+@_incremental_style_option
 @click.pass_context
 def restart(
     context: click.Context,
@@ -907,8 +974,13 @@ def restart(
     Restarts a server. Equivalent to `pyre stop && pyre`.
     """
     command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
+    original_directory: str = context.obj["cwd"]
+    configuration = _create_configuration_with_retry(
+        command_argument, Path(original_directory)
+    )
     if command_argument.use_command_v2:
+        from .commands.v2 import restart as v2_restart
+
         start_arguments = command_arguments.StartArguments(
             changed_files_path=command_argument.changed_files_path,
             debug=command_argument.debug,
@@ -923,7 +995,7 @@ def restart(
             terminal=terminal,
             wait_on_initialization=True,
         )
-        return v2.restart.run(
+        return v2_restart.run(
             configuration,
             command_arguments.IncrementalArguments(
                 output=command_argument.output,
@@ -932,20 +1004,19 @@ def restart(
             ),
         )
     else:
-        return run_pyre_command(
-            commands.Restart(
-                command_argument,
-                original_directory=os.getcwd(),
-                configuration=configuration,
-                terminal=terminal,
-                store_type_check_resolution=store_type_check_resolution,
-                use_watchman=not no_watchman,
-                incremental_style=commands.IncrementalStyle.SHALLOW
-                if incremental_style == str(commands.IncrementalStyle.SHALLOW)
-                else commands.IncrementalStyle.FINE_GRAINED,
-            ),
+        from .commands.restart import Restart
+
+        return _run_command(
+            Restart,
+            command_argument,
+            original_directory,
             configuration,
-            command_argument.noninteractive,
+            terminal=terminal,
+            store_type_check_resolution=store_type_check_resolution,
+            use_watchman=not no_watchman,
+            incremental_style=_INCREMENTAL_STYLES.get(
+                incremental_style, commands.IncrementalStyle.FINE_GRAINED
+            ),
         )
 
 
@@ -962,49 +1033,16 @@ def servers(context: click.Context, subcommand: str) -> int:
 
     - `stop`: Stop all running servers.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = configuration_module.create_configuration(
-        command_argument, Path(".")
-    )
-    return run_pyre_command(
-        commands.Servers(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            subcommand=subcommand,
-        ),
-        configuration,
-        command_argument.noninteractive,
-    )
+    from .commands.servers import Servers
+
+    return _dispatch(context, Servers, with_retry=False, subcommand=subcommand)
 
 
 @pyre.command()
-@click.option(
-    "--terminal", is_flag=True, default=False, help="Run the server in the terminal."
-)
-@click.option(
-    "--store-type-check-resolution",
-    is_flag=True,
-    default=False,
-    help="Store extra information for `types` queries.",
-)
-@click.option(
-    "--no-watchman",
-    is_flag=True,
-    default=False,
-    help="Do not spawn a watchman client in the background.",
-)
-@click.option(
-    "--incremental-style",
-    type=click.Choice(
-        [
-            str(commands.IncrementalStyle.SHALLOW),
-            str(commands.IncrementalStyle.FINE_GRAINED),
-        ]
-    ),
-    default=str(commands.IncrementalStyle.FINE_GRAINED),
-    help="[DEPRECATED] How to approach doing incremental checks.",
-)
+@_terminal_option
+@_store_type_check_resolution_option
+@_no_watchman_option
+@_incremental_style_option
 @click.option(
     "--wait-on-initialization/--no-wait-on-initialization",
     default=False,
@@ -1024,9 +1062,14 @@ def start(
     Starts a pyre server as a daemon.
     """
     command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
+    original_directory: str = context.obj["cwd"]
+    configuration = _create_configuration_with_retry(
+        command_argument, Path(original_directory)
+    )
     if command_argument.use_command_v2:
-        return v2.start.run(
+        from .commands.v2 import start as v2_start
+
+        return v2_start.run(
             configuration,
             command_arguments.StartArguments(
                 changed_files_path=command_argument.changed_files_path,
@@ -1044,20 +1087,19 @@ def start(
             ),
         )
     else:
-        return run_pyre_command(
-            commands.Start(
-                command_argument,
-                original_directory=os.getcwd(),
-                configuration=configuration,
-                terminal=terminal,
-                store_type_check_resolution=store_type_check_resolution,
-                use_watchman=not no_watchman,
-                incremental_style=commands.IncrementalStyle.SHALLOW
-                if incremental_style == str(commands.IncrementalStyle.SHALLOW)
-                else commands.IncrementalStyle.FINE_GRAINED,
-            ),
+        from .commands.start import Start
+
+        return _run_command(
+            Start,
+            command_argument,
+            original_directory,
             configuration,
-            command_argument.noninteractive,
+            terminal=terminal,
+            store_type_check_resolution=store_type_check_resolution,
+            use_watchman=not no_watchman,
+            incremental_style=_INCREMENTAL_STYLES.get(
+                incremental_style, commands.IncrementalStyle.FINE_GRAINED
+            ),
         )
 
 
@@ -1077,18 +1119,10 @@ def statistics(
     """
     Collect various syntactic metrics on type coverage.
     """
-    command_argument: command_arguments.CommandArguments = context.obj["arguments"]
-    configuration = _create_configuration_with_retry(command_argument, Path("."))
-    return run_pyre_command(
-        commands.Statistics(
-            command_argument,
-            original_directory=os.getcwd(),
-            configuration=configuration,
-            filter_paths=list(filter_paths),
-            log_results=log_results,
-        ),
-        configuration,
-        command_argument.noninteractive,
+    from .commands.statistics import Statistics
+
+    return _dispatch(
+        context, Statistics, filter_paths=filter_paths, log_results=log_results
     )
 
 
@@ -1099,48 +1133,69 @@ def stop(context: click.Context) -> int:
     Signals the Pyre server to stop.
     """
     command_argument: command_arguments.CommandArguments = context.obj["arguments"]
+    original_directory: str = context.obj["cwd"]
     configuration = configuration_module.create_configuration(
-        command_argument, Path(".")
+        command_argument, Path(original_directory)
     )
     if command_argument.use_command_v2:
-        return v2.stop.run(configuration)
+        from .commands.v2 import stop as v2_stop
+
+        return v2_stop.run(configuration)
     else:
-        return run_pyre_command(
-            commands.Stop(
-                command_argument,
-                original_directory=os.getcwd(),
-                configuration=configuration,
-            ),
-            configuration,
-            command_argument.noninteractive,
+        from .commands.stop import Stop
+
+        return _run_command(Stop, command_argument, original_directory, configuration)
+
+
+_NONINTERACTIVE_FLAGS = frozenset(("-n", "--noninteractive"))
+
+
+def _auto_envvar_prefix(argv: List[str]) -> Optional[str]:
+    # Click looks up an environment variable for every option when given a
+    # prefix. Skip that when none could match, unless the help text needs to
+    # show the variable names.
+    if "--help" in argv or any(name.startswith("PYRE_") for name in os.environ):
+        return "PYRE"
+    return None
+
+
+def _invoke_pyre(argv: List[str], cwd: Optional[str]) -> int:
+    try:
+        return pyre(
+            argv,
+            auto_envvar_prefix=_auto_envvar_prefix(argv),
+            standalone_mode=False,
+            obj={"cwd": os.getcwd() if cwd is None else cwd},
         )
+    except configuration_module.InvalidConfiguration as error:
+        LOG.error(str(error))
+        return ExitCode.CONFIGURATION_ERROR
+    except click.ClickException as error:
+        error.show()
+        return ExitCode.FAILURE
+    except Exception as error:
+        LOG.error(str(error))
+        return ExitCode.FAILURE
 
 
 # Need the default argument here since this is our entry point in setup.py
-def main(argv: List[str] = sys.argv[1:]) -> int:
-    noninteractive = ("-n" in argv) or ("--noninteractive" in argv)
+def main(argv: List[str] = sys.argv[1:], cwd: Optional[str] = None) -> int:
+    if "--help" in argv:
+        # Click prints the help text and exits before any command runs, so there
+        # is nothing to log and no need to set up (and tear down) the terminal.
+        return _invoke_pyre(argv, cwd)
+    noninteractive = any(argument in _NONINTERACTIVE_FLAGS for argument in argv)
     with log.configured_logger(noninteractive):
-        try:
-            return_code = pyre(argv, auto_envvar_prefix="PYRE", standalone_mode=False)
-        except configuration_module.InvalidConfiguration as error:
-            LOG.error(str(error))
-            return ExitCode.CONFIGURATION_ERROR
-        except click.ClickException as error:
-            error.show()
-            return_code = ExitCode.FAILURE
-        except Exception as error:
-            LOG.error(str(error))
-            return_code = ExitCode.FAILURE
-    return return_code
+        return _invoke_pyre(argv, cwd)
 
 
 if __name__ == "__main__":
     try:
-        os.getcwd()
+        current_directory = os.getcwd()
     except FileNotFoundError:
         LOG.error(
             "Pyre could not determine the current working directory. "
             "Has it been removed?\nExiting."
         )
         sys.exit(ExitCode.FAILURE)
-    sys.exit(main(sys.argv[1:]))
+    sys.exit(main(sys.argv[1:], current_directory))
@@ -6,6 +6,7 @@
 import dataclasses
 import hashlib
 import json
+import os
 import shutil
 import subprocess
 import tempfile
@@ -43,14 +44,14 @@ class PartialConfigurationTest(unittest.TestCase):
                 local_configuration=None,
                 logger="logger",
                 formatter="formatter",
-                targets=[],
+                targets=(),
                 use_buck_builder=False,
                 use_buck_source_database=True,
-                source_directories=[],
-                search_path=["x", "y"],
+                source_directories=(),
+                search_path=("x", "y"),
                 binary="binary",
                 buck_builder_binary="buck_builder_binary",
-                exclude=["excludes"],
+                exclude=("excludes",),
                 typeshed="typeshed",
                 dot_pyre_directory=Path(".pyre"),
             )
@@ -281,6 +282,26 @@ class PartialConfigurationTest(unittest.TestCase):
         assert_raises(json.dumps({"use_buck_source_database": 4.2}))
         assert_raises(json.dumps({"version": 123}))
 
+    def test_create_from_file(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            configuration_path = Path(root) / ".pyre_configuration"
+            configuration_path.write_text(json.dumps({"strict": True}))
+
+            configuration = PartialConfiguration.from_file(configuration_path)
+            self.assertEqual(configuration.strict, True)
+            self.assertIs(
+                PartialConfiguration.from_file(configuration_path), configuration
+            )
+
+            configuration_path.write_text(json.dumps({"strict": False}))
+            os.utime(configuration_path, ns=(0, 0))
+            self.assertEqual(
+                PartialConfiguration.from_file(configuration_path).strict, False
+            )
+
+            with self.assertRaises(InvalidConfiguration):
+                PartialConfiguration.from_file(Path(root) / "nonexistent")
+
     def test_merge(self) -> None:
         # Unsafe features like `getattr` has to be used in this test to reduce boilerplates.
 
@@ -911,7 +932,7 @@ class ConfigurationTest(testslide.TestCase):
             with switch_working_directory(root_path):
                 configuration = create_configuration(
                     command_arguments.CommandArguments(
-                        source_directories=["."], dot_pyre_directory=None
+                        source_directories=(".",), dot_pyre_directory=None
                     ),
                     base_directory=Path(root),
                 )
@@ -928,7 +949,7 @@ class ConfigurationTest(testslide.TestCase):
                 configuration = create_configuration(
                     command_arguments.CommandArguments(
                         strict=True,  # override configuration file
-                        source_directories=["."],
+                        source_directories=(".",),
                         dot_pyre_directory=Path(".pyre"),
                     ),
                     base_directory=Path(root),
@@ -955,7 +976,7 @@ class ConfigurationTest(testslide.TestCase):
                 configuration = create_configuration(
                     command_arguments.CommandArguments(
                         local_configuration="local",
-                        source_directories=["."],
+                        source_directories=(".",),
                         dot_pyre_directory=Path(".pyre"),
                     ),
                     base_directory=Path(root),
@@ -973,6 +994,43 @@ class ConfigurationTest(testslide.TestCase):
                     ],
                 )
 
+    def test_create_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            root_path = Path(root)
+            write_configuration_file(root_path, {"source_directories": ["."]})
+            arguments = command_arguments.CommandArguments(
+                dot_pyre_directory=Path(".pyre")
+            )
+
+            configuration = create_configuration(arguments, root_path)
+            self.assertIs(create_configuration(arguments, root_path), configuration)
+
+            write_configuration_file(root_path, {"source_directories": ["a"]})
+            os.utime(root_path / ".pyre_configuration", ns=(0, 0))
+            self.assertListEqual(
+                list(create_configuration(arguments, root_path).source_directories),
+                [str(root_path / "a")],
+            )
+
+    def test_create_from_local_configuration_override(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            root_path = Path(root)
+            write_configuration_file(root_path, {})
+            write_configuration_file(root_path, {"strict": True}, relative="local")
+
+            with switch_working_directory(root_path):
+                configuration = create_configuration(
+                    command_arguments.CommandArguments(
+                        local_configuration="nonexistent",
+                        source_directories=(".",),
+                        dot_pyre_directory=Path(".pyre"),
+                    ),
+                    base_directory=Path(root),
+                    local_configuration_override="local",
+                )
+                self.assertEqual(configuration.relative_local_root, "local")
+                self.assertEqual(configuration.strict, True)
+
     def test_check_nested_local_configuration_no_nesting(self) -> None:
         with tempfile.TemporaryDirectory() as root:
             root_path = Path(root)
@@ -21,7 +21,10 @@ from ..analysis_directory import (
     NotWithinLocalConfigurationException,
     SharedAnalysisDirectory,
 )
+from ..commands.check import Check
 from ..commands.command import __name__ as command_name
+from ..commands.restart import Restart
+from ..commands.start import Start
 from ..filesystem import (
     Filesystem,
     MercurialBackedFilesystem,
@@ -419,7 +422,7 @@ class FilesystemTest(unittest.TestCase):
     ) -> None:
         arguments = MagicMock()
         arguments.source_directories = []
-        arguments.command = commands.Check
+        arguments.command = Check
         arguments.use_buck_builder = False
         arguments.ignore_unbuilt_dependencies = False
         arguments.local_configuration = None
@@ -476,9 +479,7 @@ class FilesystemTest(unittest.TestCase):
             arguments.targets = ["arguments_target"]
             configuration.source_directories = ["configuration_source_directory"]
 
-            command = commands.Check(
-                arguments, original_directory, configuration=configuration
-            )
+            command = Check(arguments, original_directory, configuration=configuration)
             analysis_directory = command._analysis_directory
             assert isinstance(analysis_directory, SharedAnalysisDirectory)
             analysis_directory._resolve_source_directories()
@@ -494,7 +495,7 @@ class FilesystemTest(unittest.TestCase):
             # same test as above, but Start instead of Check; build should be False
             cwd.return_value = "/"
             original_directory = "/root"
-            command = commands.Start(
+            command = Start(
                 arguments,
                 original_directory,
                 terminal=False,
@@ -518,7 +519,7 @@ class FilesystemTest(unittest.TestCase):
         ) as buck_source_directories:
             cwd.side_effect = ["/", "/", "/"]
             original_directory = "/root"
-            command = commands.Start(
+            command = Start(
                 arguments,
                 original_directory,
                 terminal=False,
@@ -531,7 +532,7 @@ class FilesystemTest(unittest.TestCase):
             assert isinstance(analysis_directory, SharedAnalysisDirectory)
             analysis_directory._resolve_source_directories()
             buck_source_directories.assert_called_with(["arguments_target"])
-            command = commands.Restart(
+            command = Restart(
                 arguments,
                 original_directory,
                 configuration=configuration,
@@ -555,13 +556,11 @@ class FilesystemTest(unittest.TestCase):
             original_directory = "/root"
             arguments.source_directories = []
             arguments.targets = []
-            arguments.command = commands.Check
+            arguments.command = Check
             configuration.targets = ["configuration_target"]
             configuration.source_directories = []
 
-            command = commands.Check(
-                arguments, original_directory, configuration=configuration
-            )
+            command = Check(arguments, original_directory, configuration=configuration)
             analysis_directory = command._analysis_directory
             assert isinstance(analysis_directory, SharedAnalysisDirectory)
             analysis_directory._resolve_source_directories()
@@ -582,9 +581,7 @@ class FilesystemTest(unittest.TestCase):
             arguments.targets = []
             configuration.targets = ["."]
 
-            command = commands.Check(
-                arguments, original_directory, configuration=configuration
-            )
+            command = Check(arguments, original_directory, configuration=configuration)
             analysis_directory = command._analysis_directory
             assert isinstance(analysis_directory, SharedAnalysisDirectory)
             analysis_directory._resolve_source_directories()
@@ -39,7 +39,7 @@ def mock_arguments(
         debug=debug,
         sequential=sequential,
         strict=False,
-        additional_checks=[],
+        additional_checks=(),
         show_error_traces=False,
         output=output,
         enable_profiling=enable_profiling,
@@ -49,17 +49,17 @@ def mock_arguments(
         log_identifier=log_identifier,
         logger=None,
         formatter=None,
-        targets=targets or [],
+        targets=tuple(targets or ()),
         use_buck_builder=False,
         use_buck_source_database=False,
-        source_directories=source_directories or [],
+        source_directories=tuple(source_directories or ()),
         filter_directory=None,
         buck_mode=None,
         no_saved_state=no_saved_state,
-        search_path=["some_path"],
+        search_path=("some_path",),
         binary="/foo/binary.exe",
         buck_builder_binary=None,
-        exclude=[],
+        exclude=(),
         typeshed="/typeshed",
         save_initial_state_to=save_initial_state_to,
         load_initial_state_from=load_initial_state_from,
@@ -5,6 +5,11 @@
 
 # pyre-unsafe
 
+import contextlib
+import io
+import os
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -13,13 +18,17 @@ from unittest.mock import MagicMock, call, patch
 import testslide
 
 from .. import (
+    buck,
     command_arguments,
     commands,
     configuration,
+    log,
     pyre,
     recently_used_configurations,
     statistics,
 )
+from ..commands.persistent import Persistent
+from ..commands.start import Start
 from ..exceptions import EnvironmentException
 from .mocks import mock_incremental_command
 from .setup import (
@@ -30,8 +39,8 @@ from .setup import (
 
 
 class PyreTest(unittest.TestCase):
-    @patch.object(commands.Start, "run")
-    @patch.object(commands.Persistent, "run_null_server")
+    @patch.object(Start, "run")
+    @patch.object(Persistent, "run_null_server")
     def test_persistent_integration(
         self, run_null_server: MagicMock, run_start: MagicMock
     ) -> None:
@@ -43,6 +52,13 @@ class PyreTest(unittest.TestCase):
         self.assertEqual(pyre.main(["persistent"]), 0)
         run_null_server.assert_has_calls([call(timeout=3600 * 12)])
 
+    @patch.object(log, "configured_logger")
+    def test_help_skips_logger(self, configured_logger: MagicMock) -> None:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(pyre.main(["stop", "--help"]), 0)
+        self.assertIn("Usage:", output.getvalue())
+        configured_logger.assert_not_called()
+
     # pyre-fixme[56]: Argument `tools.pyre.client.statistics` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
     @patch.object(statistics, "log")
@@ -52,8 +68,24 @@ class PyreTest(unittest.TestCase):
         )
         command = mock_incremental_command(test_configuration)
         pyre._log_statistics(command, 0.0, "foo", "bar", 42)
+        pyre._flush_statistics()
         statistics_log.assert_called_once()
 
+    @patch.object(statistics, "log")
+    def test_log_statistics__forget_finished_threads(
+        self, statistics_log: MagicMock
+    ) -> None:
+        test_configuration = configuration.Configuration(
+            project_root="irrelevant", dot_pyre_directory=Path(".pyre"), logger="logger"
+        )
+        command = mock_incremental_command(test_configuration)
+        pyre._log_statistics(command, 0.0, "foo", "bar", 42)
+        pyre._STATISTICS_THREADS[-1].join()
+        pyre._log_statistics(command, 0.0, "foo", "bar", 42)
+        self.assertEqual(len(pyre._STATISTICS_THREADS), 1)
+        pyre._flush_statistics()
+        self.assertEqual(statistics_log.call_count, 2)
+
     # pyre-fixme[56]: Argument `tools.pyre.client.statistics` to decorator factory
     #  `unittest.mock.patch.object` could not be resolved in a global scope.
     @patch.object(statistics, "log")
@@ -63,8 +95,87 @@ class PyreTest(unittest.TestCase):
         )
         command = mock_incremental_command(test_configuration)
         pyre._log_statistics(command, 0.0, "foo", "bar", 42, should_log=False)
+        pyre._flush_statistics()
         statistics_log.assert_not_called()
 
+    @patch.object(log, "start_logging_to_directory")
+    def test_run_pyre_command__exceptions(self, start_logging: MagicMock) -> None:
+        test_configuration = configuration.Configuration(
+            project_root="irrelevant", dot_pyre_directory=Path(".pyre")
+        )
+        command = mock_incremental_command(test_configuration)
+
+        def assert_exit_code(
+            exception: BaseException, exit_code: commands.ExitCode
+        ) -> None:
+            with patch.object(command, "run", side_effect=exception):
+                self.assertEqual(
+                    pyre.run_pyre_command(command, test_configuration, True),
+                    exit_code,
+                )
+
+        assert_exit_code(buck.BuckException(), commands.ExitCode.BUCK_ERROR)
+        assert_exit_code(EnvironmentException(), commands.ExitCode.FAILURE)
+        assert_exit_code(commands.ClientException(), commands.ExitCode.FAILURE)
+        assert_exit_code(RuntimeError(), commands.ExitCode.FAILURE)
+        assert_exit_code(KeyboardInterrupt(), commands.ExitCode.SUCCESS)
+        with self.assertRaises(SystemExit):
+            assert_exit_code(SystemExit(), commands.ExitCode.FAILURE)
+
+    def test_auto_envvar_prefix(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(pyre._auto_envvar_prefix(["check"]))
+            self.assertEqual(pyre._auto_envvar_prefix(["check", "--help"]), "PYRE")
+        with patch.dict(os.environ, {"PYRE_BINARY": "/bin/pyre.bin"}, clear=True):
+            self.assertEqual(pyre._auto_envvar_prefix(["check"]), "PYRE")
+
+    @patch.object(configuration, "create_configuration")
+    @patch.object(configuration, "query_binary_version", return_value="abc")
+    def test_show_pyre_version__explicit_binary(
+        self, query_binary_version: MagicMock, create_configuration: MagicMock
+    ) -> None:
+        pyre._show_pyre_version(
+            command_arguments.CommandArguments(version=True, binary="/bin/pyre.bin"),
+            Path("/root"),
+        )
+        query_binary_version.assert_called_once_with("/bin/pyre.bin")
+        create_configuration.assert_not_called()
+
+    @patch("shutil.which", return_value="/bin/watchman")
+    def test_watchman_path(self, which: MagicMock) -> None:
+        pyre._watchman_path.cache_clear()
+        self.assertEqual(pyre._watchman_path("/bin"), "/bin/watchman")
+        self.assertEqual(pyre._watchman_path("/bin"), "/bin/watchman")
+        which.assert_called_once_with("watchman", path="/bin")
+
+        pyre._watchman_path("/bin:/usr/bin")
+        self.assertEqual(which.call_count, 2)
+        pyre._watchman_path.cache_clear()
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_commands_are_imported_lazily(self) -> None:
+        # Run in a fresh interpreter so that modules imported by other tests do not
+        # leak into `sys.modules`.
+        package_root = Path(pyre.__file__).parents[pyre.__name__.count(".")]
+        script = "\n".join(
+            [
+                "import importlib, sys",
+                f"importlib.import_module({pyre.__name__!r})",
+                f"prefix = {commands.__name__!r}",
+                "print(sorted(name for name in sys.modules",
+                "    if name.startswith(prefix + '.') or name == 'libcst'))",
+            ]
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=str(package_root),
+            stdout=subprocess.PIPE,
+            check=True,
+            universal_newlines=True,
+        ).stdout
+        self.assertEqual(output.strip(), repr([f"{commands.__name__}.command"]))
+
 
 class CreateConfigurationWithRetryTest(testslide.TestCase):
     def test_create_configuration_with_retry__no_retry(self) -> None:
@@ -78,7 +189,7 @@ class CreateConfigurationWithRetryTest(testslide.TestCase):
                     pyre._create_configuration_with_retry(
                         command_arguments.CommandArguments(
                             local_configuration=None,
-                            source_directories=["."],
+                            source_directories=(".",),
                             dot_pyre_directory=Path(".pyre"),
                         ),
                         base_directory=Path(root),
@@ -97,11 +208,30 @@ class CreateConfigurationWithRetryTest(testslide.TestCase):
                     pyre._create_configuration_with_retry(
                         command_arguments.CommandArguments(
                             local_configuration=None,
-                            source_directories=[],
+                            source_directories=(),
+                            dot_pyre_directory=Path(".pyre"),
+                        ),
+                        base_directory=Path(root),
+                    )
+
+    def test_create_configuration_with_retry__no_dot_pyre_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            root_path = Path(root)
+            write_configuration_file(root_path, {})
+
+            with switch_working_directory(root_path), patch.object(
+                recently_used_configurations, "Cache"
+            ) as cache:
+                with self.assertRaises(configuration.InvalidConfiguration):
+                    pyre._create_configuration_with_retry(
+                        command_arguments.CommandArguments(
+                            local_configuration=None,
+                            source_directories=(),
                             dot_pyre_directory=Path(".pyre"),
                         ),
                         base_directory=Path(root),
                     )
+                cache.assert_not_called()
 
     def test_create_configuration_with_retry__success(self) -> None:
         self.mock_callable(
@@ -121,7 +251,7 @@ class CreateConfigurationWithRetryTest(testslide.TestCase):
                 test_configuration = pyre._create_configuration_with_retry(
                     command_arguments.CommandArguments(
                         local_configuration=None,
-                        source_directories=[],
+                        source_directories=(),
                         dot_pyre_directory=Path(".pyre"),
                     ),
                     base_directory=Path(root),
@@ -149,7 +279,7 @@ class CreateConfigurationWithRetryTest(testslide.TestCase):
                     pyre._create_configuration_with_retry(
                         command_arguments.CommandArguments(
                             local_configuration=None,
-                            source_directories=[],
+                            source_directories=(),
                             dot_pyre_directory=Path(".pyre"),
                         ),
                         base_directory=Path(root),
@@ -174,7 +304,7 @@ class CreateConfigurationWithRetryTest(testslide.TestCase):
                     pyre._create_configuration_with_retry(
                         command_arguments.CommandArguments(
                             local_configuration=None,
-                            source_directories=[],
+                            source_directories=(),
                             dot_pyre_directory=Path(".pyre"),
                         ),
                         base_directory=Path(root),